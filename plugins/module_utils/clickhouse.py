@@ -10,6 +10,8 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import re
+
 from ansible.module_utils.basic import missing_required_lib
 from ansible.module_utils._text import to_native
 
@@ -23,6 +25,12 @@ except ImportError:
 
 PRIV_ERR_CODE = 497
 
+# For example, 23.12.2.59 or 24.3.1.2672-lts
+SERVER_VERSION_REGEX = re.compile(
+    r'^(?P<year>\d+)\.(?P<feature>\d+)\.(?P<maintenance>\d+)\.(?P<build>\d+)'
+    r'(?:-(?P<type>[^.-]*))?'
+)
+
 
 def client_common_argument_spec():
     """
@@ -46,16 +54,17 @@ def get_main_conn_kwargs(module):
 
     Returns a dictionary of arguments with values to pass to Client().
     """
+    params = module.params
     main_conn_kwargs = {}
-    main_conn_kwargs['host'] = module.params['login_host']  # Has a default value
-    if module.params['login_port']:
-        main_conn_kwargs['port'] = module.params['login_port']
-    if module.params['login_db']:
-        main_conn_kwargs['database'] = module.params['login_db']
-    if module.params['login_user']:
-        main_conn_kwargs['user'] = module.params['login_user']
-    if module.params['login_password']:
-        main_conn_kwargs['password'] = module.params['login_password']
+    main_conn_kwargs['host'] = params['login_host']  # Has a default value
+    if params['login_port']:
+        main_conn_kwargs['port'] = params['login_port']
+    if params['login_db']:
+        main_conn_kwargs['database'] = params['login_db']
+    if params['login_user']:
+        main_conn_kwargs['user'] = params['login_user']
+    if params['login_password']:
+        main_conn_kwargs['password'] = params['login_password']
     return main_conn_kwargs
 
 
@@ -82,9 +91,12 @@ def connect_to_db_via_client(module, main_conn_kwargs, client_kwargs):
     """
     try:
         # Merge the kwargs as Python 2 would through an error
-        # when unpaking them separately to Client()
-        client_kwargs.update(main_conn_kwargs)
-        client = Client(**client_kwargs)
+        # when unpaking them separately to Client().
+        # Do it in a copy to leave the passed dictionary intact
+        # as it can be used to open more connections
+        kwargs = dict(client_kwargs)
+        kwargs.update(main_conn_kwargs)
+        client = Client(**kwargs)
     except Exception as e:
         module.fail_json(msg="Failed to connect to database: %s" % to_native(e))
 
@@ -111,7 +123,8 @@ def execute_query(module, client, query, execute_kwargs=None, set_settings=None)
                 client.execute("SET %s = '%s'" % (setting, set_settings[setting]))
         result = client.execute(query, **execute_kwargs)
     except Exception as e:
-        if "Not enough privileges" in to_native(e):
+        # Server errors raised by the driver carry the error code
+        if getattr(e, 'code', None) == PRIV_ERR_CODE:
             return PRIV_ERR_CODE
         module.fail_json(msg="Failed to execute query: %s" % to_native(e))
 
@@ -121,29 +134,34 @@ def execute_query(module, client, query, execute_kwargs=None, set_settings=None)
 def get_server_version(module, client):
     """Get server version.
 
-    Returns a dictionary with server version.
+    The version cannot change while connected, so it is
+    requested only once per client and stored on the client object.
+
+    Returns a copy of the dictionary with server version.
     """
+    cached = getattr(client, '_ch_server_version', None)
+    if cached is not None:
+        return dict(cached)
+
     result = execute_query(module, client, "SELECT version()")
 
     if result == PRIV_ERR_CODE:
         return {PRIV_ERR_CODE: "Not enough privileges"}
 
     raw = result[0][0]
-    split_raw = raw.split('.')
+    match = SERVER_VERSION_REGEX.match(raw)
+    if match is None:
+        module.fail_json(msg="Failed to parse server version: %s" % raw)
 
     version = {}
     version["raw"] = raw
 
-    version["year"] = int(split_raw[0])
-    version["feature"] = int(split_raw[1])
-    version["maintenance"] = int(split_raw[2])
+    version["year"] = int(match.group("year"))
+    version["feature"] = int(match.group("feature"))
+    version["maintenance"] = int(match.group("maintenance"))
+    version["build"] = int(match.group("build"))
+    version["type"] = match.group("type")
 
-    if '-' in split_raw[3]:
-        tmp = split_raw[3].split('-')
-        version["build"] = int(tmp[0])
-        version["type"] = tmp[1]
-    else:
-        version["build"] = int(split_raw[3])
-        version["type"] = None
+    client._ch_server_version = version
 
-    return version
+    return dict(version)
@@ -167,16 +167,17 @@ class ClickHouseDB():
                 self.comment = result[0][1]
 
     def create(self, engine, comment):
-        query = "CREATE DATABASE %s" % self.name
+        parts = ["CREATE DATABASE %s" % self.name]
         if engine:
-            query += " ENGINE = %s" % engine
+            parts.append("ENGINE = %s" % engine)
 
         if self.cluster:
-            query += " ON CLUSTER %s" % self.cluster
+            parts.append("ON CLUSTER %s" % self.cluster)
 
         if comment:
-            query += " COMMENT '%s'" % comment
+            parts.append("COMMENT '%s'" % comment)
 
+        query = " ".join(parts)
         executed_statements.append(query)
 
         if not self.module.check_mode:
@@ -208,10 +209,11 @@ class ClickHouseDB():
         return False
 
     def rename(self, target):
-        query = "RENAME DATABASE %s TO %s" % (self.name, target)
+        parts = ["RENAME DATABASE %s TO %s" % (self.name, target)]
         if self.cluster:
-            query += " ON CLUSTER %s" % self.cluster
+            parts.append("ON CLUSTER %s" % self.cluster)
 
+        query = " ".join(parts)
         executed_statements.append(query)
 
         if not self.module.check_mode:
@@ -220,10 +222,11 @@ class ClickHouseDB():
         return True
 
     def drop(self):
-        query = "DROP DATABASE %s" % self.name
+        parts = ["DROP DATABASE %s" % self.name]
         if self.cluster:
-            query += " ON CLUSTER %s" % self.cluster
+            parts.append("ON CLUSTER %s" % self.cluster)
 
+        query = " ".join(parts)
         executed_statements.append(query)
 
         if not self.module.check_mode:
@@ -17,6 +17,8 @@ description:
   - Gather ClickHouse server information using the
     L(clickhouse-driver,https://clickhouse-driver.readthedocs.io/en/latest) Client interface.
   - Does not change server state.
+  - The return values are gathered concurrently using up to I(max_connections)
+    connections to the server.
 
 attributes:
   check_mode:
@@ -41,6 +43,62 @@ options:
     type: list
     elements: str
     version_added: '0.2.0'
+  only_changed:
+    description:
+      - If C(true), returns only the settings that have been changed
+        in the I(settings) and I(merge_tree_settings) return values.
+      - The filtering is done by the server.
+    type: bool
+    default: false
+    version_added: '0.8.0'
+  include_grants:
+    description:
+      - If C(false), the I(users) and I(roles) return values
+        do not contain the C(grants) key.
+      - Getting the grants requires an additional query per user and role,
+        so disabling it speeds up the module when there are many of them.
+    type: bool
+    default: true
+    version_added: '0.8.0'
+  include_ddl:
+    description:
+      - If C(false), the I(tables) return value does not contain
+        the C(create_table_query) and C(engine_full) keys.
+      - They can be large, so disabling them reduces
+        the amount of data transferred from the server.
+    type: bool
+    default: true
+    version_added: '0.8.0'
+  include_exceptions:
+    description:
+      - If C(false), the I(dictionaries) return value does not contain
+        the C(last_exception) key.
+      - The exception messages can be large, so disabling them reduces
+        the amount of data transferred from the server.
+    type: bool
+    default: true
+    version_added: '0.8.0'
+  include_stats:
+    description:
+      - If C(false), the I(tables) return value does not contain the C(total_rows),
+        C(total_bytes), C(lifetime_rows) and C(lifetime_bytes) keys,
+        and the I(dictionaries) return value does not contain the C(bytes_allocated),
+        C(query_count), C(hit_rate), C(element_count) and C(load_factor) keys.
+      - The server computes the table statistics from the parts of every table,
+        so disabling them reduces the server work when there are many tables.
+    type: bool
+    default: true
+    version_added: '0.8.0'
+  max_connections:
+    description:
+      - The maximum number of connections to the server
+        used to gather the return values concurrently.
+      - Set it to C(1) to gather them one by one using a single connection,
+        for example, if the server limits the number of concurrent
+        connections or queries of I(login_user).
+    type: int
+    default: 8
+    version_added: '0.8.0'
 '''
 
 EXAMPLES = r'''
@@ -62,10 +120,31 @@ EXAMPLES = r'''
     limit:
       - users
       - roles
+
+- name: Get users and roles without their grants
+  register: result
+  community.clickhouse.clickhouse_info:
+    include_grants: false
+    limit:
+      - users
+      - roles
+
+- name: Get only changed settings
+  register: result
+  community.clickhouse.clickhouse_info:
+    only_changed: true
+    limit:
+      - settings
+      - merge_tree_settings
+
+- name: Gather values one by one using a single connection
+  register: result
+  community.clickhouse.clickhouse_info:
+    max_connections: 1
 '''
 
 # When adding new ret values,
-# please add it to the ret_val_func_mapping dictionary!
+# please add it to the RET_VAL_FUNC_MAPPING dictionary!
 RETURN = r'''
 driver:
   description: Python driver information.
@@ -88,6 +167,7 @@ users:
   description:
     - The content of the system.users table with names as keys.
     - Be sure your I(login_user) has permissions.
+    - Contains the C(grants) key only if I(include_grants=true).
   returned: success
   type: dict
   sample: { "default": "..." }
@@ -95,12 +175,14 @@ roles:
   description:
     - The content of the system.roles table with names as keys.
     - Be sure your I(login_user) has permissions.
+    - Contains the C(grants) key only if I(include_grants=true).
   returned: success
   type: dict
   sample: { "accountant": "..." }
 settings:
   description:
     - The content of the system.settings table with names as keys.
+    - Contains only changed settings if I(only_changed=true).
   returned: success
   type: dict
   sample: { "zstd_window_log_max": "..." }
@@ -113,6 +195,9 @@ clusters:
 tables:
   description:
     - The content of the system.tables table with the table names as keys.
+    - Contains the C(create_table_query) and C(engine_full) keys
+      only if I(include_ddl=true).
+    - Contains the statistics keys only if I(include_stats=true).
   returned: success
   type: dict
   sample: { "system": { "settings": "..." } }
@@ -120,6 +205,7 @@ tables:
 merge_tree_settings:
   description:
     - The content of the system.merge_tree_settings table with names as keys.
+    - Contains only changed settings if I(only_changed=true).
   returned: success
   type: dict
   sample: { "merge_max_block_size": "..." }
@@ -127,6 +213,8 @@ merge_tree_settings:
 dictionaries:
   description:
     - The content of the system.dictionaries table with dictionary names as keys.
+    - Contains the C(last_exception) key only if I(include_exceptions=true).
+    - Contains the statistics keys only if I(include_stats=true).
   returned: success
   type: dict
   sample: { "database": { "dictionary": "..." } }
@@ -168,7 +256,12 @@ settings_profile_elements:
   version_added: '0.7.0'
 '''
 
+import sys
+import threading
+
 from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.six import reraise
+from ansible.module_utils.six.moves import queue
 
 from ansible_collections.community.clickhouse.plugins.module_utils.clickhouse import (
     check_clickhouse_driver,
@@ -183,27 +276,83 @@ from ansible_collections.community.clickhouse.plugins.module_utils.clickhouse im
 
 PRIV_ERR_CODE = 497
 
+# Keys of the returned dictionaries.
+# They follow the order of the selected columns
+# that go after the column used as a top level key
+DATABASES_KEYS = ("engine", "data_path", "uuid")
+USERS_KEYS = ("id", "storage", "auth_type", "auth_params", "host_ip", "host_names",
+              "host_names_regexp", "host_names_like", "default_roles_all",
+              "default_roles_list", "default_roles_except")
+ROLES_KEYS = ("id", "storage")
+TABLES_KEYS = ("uuid", "engine", "is_temporary", "data_paths", "metadata_path",
+               "metadata_modification_time", "dependencies_database",
+               "dependencies_table", "partition_key", "sorting_key", "primary_key",
+               "sampling_key", "storage_policy")
+# Selected only if include_stats is true, the keys match the column names
+TABLES_STATS_KEYS = ("total_rows", "total_bytes", "lifetime_rows", "lifetime_bytes")
+# Selected only if include_ddl is true, the keys match the column names
+TABLES_DDL_KEYS = ("create_table_query", "engine_full")
+DICTIONARIES_KEYS = ("uuid", "status", "origin", "type", "key", "attribute.names",
+                     "attribute.types", "source", "lifetime_min", "lifetime_max",
+                     "loading_start_time", "last_successful_update_time",
+                     "loading_duration")
+# Selected only if include_stats is true, the keys match the column names
+DICTIONARIES_STATS_KEYS = ("bytes_allocated", "query_count", "hit_rate",
+                           "element_count", "load_factor")
+# Selected only if include_exceptions is true, the keys match the column names
+DICTIONARIES_EXCEPTION_KEYS = ("last_exception",)
+SETTINGS_KEYS = ("value", "changed", "description", "min", "max", "readonly", "type")
+MERGE_TREE_SETTINGS_KEYS = ("value", "changed", "description", "type")
+SETTINGS_PROFILES_KEYS = ("id", "storage", "num_elements", "apply_to_all",
+                          "apply_to_list", "apply_to_except")
+QUOTAS_KEYS = ("id", "storage", "keys", "durations", "apply_to_all",
+               "apply_to_list", "apply_to_except")
+GRANTS_KEYS = ("access_type", "database", "table", "column", "is_partial_revoke",
+               "grant_option")
+SETTINGS_PROFILE_ELEMENTS_KEYS = ("index", "setting_name", "value", "min", "max",
+                                  "inherit_profile")
+STORAGE_POLICIES_KEYS = ("volume_name", "volume_priority", "disks", "volume_type",
+                         "max_data_part_size", "move_factor", "prefer_not_to_merge")
+
+
+class WorkerFailure(Exception):
+    """Carries the fail_json() arguments from a worker thread."""
+
+    def __init__(self, kwargs):
+        super(WorkerFailure, self).__init__(kwargs.get('msg'))
+        self.kwargs = kwargs
+
+
+class WorkerModule(object):
+    """Module proxy passed to the functions run in worker threads.
+
+    AnsibleModule.fail_json() prints the result and exits, so it must be
+    called only once and from the main thread. The proxy raises
+    WorkerFailure instead, everything else is taken from the module.
+    """
+
+    def __init__(self, module):
+        self._module = module
+
+    def __getattr__(self, name):
+        return getattr(self._module, name)
+
+    def fail_json(self, **kwargs):
+        raise WorkerFailure(kwargs)
+
 
 def get_databases(module, client):
     """Get databases.
 
     Returns a dictionary with database names as keys.
     """
-    query = "SELECT name, engine, data_path, uuid FROM system.databases"
+    query = "SELECT name, engine, data_path, toString(uuid) FROM system.databases"
     result = execute_query(module, client, query)
 
     if result == PRIV_ERR_CODE:
         return {PRIV_ERR_CODE: "Not enough privileges"}
 
-    db_info = {}
-    for row in result:
-        db_info[row[0]] = {
-            "engine": row[1],
-            "data_path": row[2],
-            "uuid": str(row[3]),
-        }
-
-    return db_info
+    return {row[0]: dict(zip(DATABASES_KEYS, row[1:])) for row in result}
 
 
 def get_clusters(module, client):
@@ -222,42 +371,32 @@ def get_clusters(module, client):
     cluster_info = {}
 
     for row in result:
-        cluster = row[0]
-        shard_num = row[1]
-        shard_weight = row[2]
-        replica_num = row[3]
-        host_name = row[4]
-        host_address = row[5]
-        port = row[6]
-        is_local = row[7]
-        user = row[8]
-        default_database = row[9]
-        errors_count = row[10]
-        estimated_recovery_time = row[11]
+        # Unpack all columns so that a mismatch between
+        # the query and this loop fails loudly
+        (cluster, shard_num, shard_weight, replica_num, host_name,
+         host_address, port, is_local, user, default_database,
+         errors_count, estimated_recovery_time) = row
 
         # Add cluster if not already there
-        if cluster not in cluster_info:
-            cluster_info[cluster] = {"shards": {}}
+        shards = cluster_info.setdefault(cluster, {"shards": {}})["shards"]
 
         # Add shard if not already there
-        if shard_num not in cluster_info[cluster]["shards"]:
-            cluster_info[cluster]["shards"][shard_num] = {
-                "shard_weight": shard_weight,
-                "replicas": {},
-            }
+        replicas = shards.setdefault(shard_num, {
+            "shard_weight": shard_weight,
+            "replicas": {},
+        })["replicas"]
 
         # Add replica if not already there
-        if replica_num not in cluster_info[cluster]["shards"][shard_num]["replicas"]:
-            cluster_info[cluster]["shards"][shard_num]["replicas"][replica_num] = {
-                "host_name": host_name,
-                "host_address": host_address,
-                "port": port,
-                "is_local": is_local,
-                "user": user,
-                "default_database": default_database,
-                "errors_count": errors_count,
-                "estimated_recovery_time": estimated_recovery_time,
-            }
+        replicas.setdefault(replica_num, {
+            "host_name": host_name,
+            "host_address": host_address,
+            "port": port,
+            "is_local": is_local,
+            "user": user,
+            "default_database": default_database,
+            "errors_count": errors_count,
+            "estimated_recovery_time": estimated_recovery_time,
+        })
 
     return cluster_info
 
@@ -267,7 +406,7 @@ def get_roles(module, client):
 
     Returns a dictionary with roles names as keys.
     """
-    query = "SELECT name, id, storage FROM system.roles"
+    query = "SELECT name, toString(id), storage FROM system.roles"
     result = execute_query(module, client, query)
 
     if result == PRIV_ERR_CODE:
@@ -276,11 +415,9 @@ def get_roles(module, client):
     roles_info = {}
     for row in result:
         role_name = row[0]
-        roles_info[role_name] = {
-            "id": str(row[1]),
-            "storage": row[2],
-        }
-        roles_info[role_name]["grants"] = get_grants(module, client, role_name)
+        roles_info[role_name] = dict(zip(ROLES_KEYS, row[1:]))
+        if module.params['include_grants']:
+            roles_info[role_name]["grants"] = get_grants(module, client, role_name)
 
     return roles_info
 
@@ -291,11 +428,21 @@ def get_tables(module, client):
     Returns a dictionary with databases name as dictionary,
     and the name of the table in this dictionary is the key.
     """
-    query = ("SELECT database, name, uuid, engine, is_temporary, data_paths, "
+    query = ("SELECT database, name, toString(uuid), engine, is_temporary, data_paths, "
              "metadata_path, metadata_modification_time, dependencies_database, "
-             "dependencies_table, create_table_query, engine_full, partition_key, "
-             "sorting_key, primary_key, sampling_key, storage_policy, total_rows, total_bytes, "
-             "lifetime_rows, lifetime_bytes FROM system.tables")
+             "dependencies_table, partition_key, sorting_key, primary_key, "
+             "sampling_key, storage_policy")
+    keys = TABLES_KEYS
+    # The statistics are computed from the parts of every table
+    if module.params['include_stats']:
+        query += ", %s" % ", ".join(TABLES_STATS_KEYS)
+        keys += TABLES_STATS_KEYS
+    # The DDL columns can be large, so they are optional
+    if module.params['include_ddl']:
+        query += ", %s" % ", ".join(TABLES_DDL_KEYS)
+        keys += TABLES_DDL_KEYS
+    query += " FROM system.tables"
+
     result = execute_query(module, client, query)
 
     if result == PRIV_ERR_CODE:
@@ -303,29 +450,7 @@ def get_tables(module, client):
 
     tables_info = {}
     for row in result:
-        if row[0] not in tables_info:
-            tables_info[row[0]] = {}
-        tables_info[row[0]][row[1]] = {
-            "uuid": str(row[2]),
-            "engine": row[3],
-            "is_temporary": row[4],
-            "data_paths": row[5],
-            "metadata_path": row[6],
-            "metadata_modification_time": row[7],
-            "dependencies_database": row[8],
-            "dependencies_table": row[9],
-            "create_table_query": row[10],
-            "engine_full": row[11],
-            "partition_key": row[12],
-            "sorting_key": row[13],
-            "primary_key": row[14],
-            "sampling_key": row[15],
-            "storage_policy": row[16],
-            "total_rows": row[17],
-            "total_bytes": row[18],
-            "lifetime_rows": row[19],
-            "lifetime_bytes": row[20],
-        }
+        tables_info.setdefault(row[0], {})[row[1]] = dict(zip(keys, row[2:]))
 
     return tables_info
 
@@ -336,11 +461,20 @@ def get_dictionaries(module, client):
     Returns a dictionary with databases name as dictionary,
     and the name of the 'dictionary' in this dictionary is the key.
     """
-    query = ("SELECT database, name, uuid, status, origin, type, key, "
-             "attribute.names, attribute.types, bytes_allocated, query_count, "
-             "hit_rate, element_count, load_factor, source, lifetime_min, "
+    query = ("SELECT database, name, toString(uuid), status, origin, type, key, "
+             "attribute.names, attribute.types, source, lifetime_min, "
              "lifetime_max, loading_start_time, last_successful_update_time, "
-             "loading_duration, last_exception FROM system.dictionaries")
+             "loading_duration")
+    keys = DICTIONARIES_KEYS
+    if module.params['include_stats']:
+        query += ", %s" % ", ".join(DICTIONARIES_STATS_KEYS)
+        keys += DICTIONARIES_STATS_KEYS
+    # The exception messages can be large, so they are optional
+    if module.params['include_exceptions']:
+        query += ", %s" % ", ".join(DICTIONARIES_EXCEPTION_KEYS)
+        keys += DICTIONARIES_EXCEPTION_KEYS
+    query += " FROM system.dictionaries"
+
     result = execute_query(module, client, query)
 
     if result == PRIV_ERR_CODE:
@@ -349,29 +483,7 @@ def get_dictionaries(module, client):
     dictionaries_info = {}
     for row in result:
         dict_database = row[0] if row[0] else 'dict'
-        if dict_database not in dictionaries_info:
-            dictionaries_info[dict_database] = {}
-        dictionaries_info[dict_database][row[1]] = {
-            "uuid": str(row[2]),
-            "status": row[3],
-            "origin": row[4],
-            "type": row[5],
-            "key": row[6],
-            "attribute.names": row[7],
-            "attribute.types": row[8],
-            "bytes_allocated": row[9],
-            "query_count": row[10],
-            "hit_rate": row[11],
-            "element_count": row[12],
-            "load_factor": row[13],
-            "source": row[14],
-            "lifetime_min": row[15],
-            "lifetime_max": row[16],
-            "loading_start_time": row[17],
-            "last_successful_update_time": row[18],
-            "loading_duration": row[19],
-            "last_exception": row[20],
-        }
+        dictionaries_info.setdefault(dict_database, {})[row[1]] = dict(zip(keys, row[2:]))
 
     return dictionaries_info
 
@@ -383,24 +495,14 @@ def get_settings(module, client):
     """
     query = ("SELECT name, value, changed, description, min, max, readonly, "
              "type FROM system.settings")
+    if module.params['only_changed']:
+        query += " WHERE changed"
     result = execute_query(module, client, query)
 
     if result == PRIV_ERR_CODE:
         return {PRIV_ERR_CODE: "Not enough privileges"}
 
-    settings_info = {}
-    for row in result:
-        settings_info[row[0]] = {
-            "value": row[1],
-            "changed": row[2],
-            "description": row[3],
-            "min": row[4],
-            "max": row[5],
-            "readonly": row[6],
-            "type": row[7],
-        }
-
-    return settings_info
+    return {row[0]: dict(zip(SETTINGS_KEYS, row[1:])) for row in result}
 
 
 def get_merge_tree_settings(module, client):
@@ -410,21 +512,14 @@ def get_merge_tree_settings(module, client):
     """
     query = ("SELECT name, value, changed, description, "
              "type FROM system.merge_tree_settings")
+    if module.params['only_changed']:
+        query += " WHERE changed"
     result = execute_query(module, client, query)
 
     if result == PRIV_ERR_CODE:
         return {PRIV_ERR_CODE: "Not enough privileges"}
 
-    merge_tree_settings_info = {}
-    for row in result:
-        merge_tree_settings_info[row[0]] = {
-            "value": row[1],
-            "changed": row[2],
-            "description": row[3],
-            "type": row[4],
-        }
-
-    return merge_tree_settings_info
+    return {row[0]: dict(zip(MERGE_TREE_SETTINGS_KEYS, row[1:])) for row in result}
 
 
 def get_users(module, client):
@@ -432,7 +527,7 @@ def get_users(module, client):
 
     Returns a dictionary with users names as keys.
     """
-    query = ("SELECT name, id, storage, auth_type, auth_params, host_ip, host_names, "
+    query = ("SELECT name, toString(id), storage, auth_type, auth_params, host_ip, host_names, "
              "host_names_regexp, host_names_like, default_roles_all, "
              "default_roles_list, default_roles_except FROM system.users")
     result = execute_query(module, client, query)
@@ -440,25 +535,18 @@ def get_users(module, client):
     if result == PRIV_ERR_CODE:
         return {PRIV_ERR_CODE: "Not enough privileges"}
 
+    # Fetch the granted roles of all users at once
+    # instead of querying them for every user
+    user_roles = get_user_roles(module, client)
+
     user_info = {}
     for row in result:
         user_name = row[0]
-        user_info[user_name] = {
-            "id": str(row[1]),
-            "storage": row[2],
-            "auth_type": row[3],
-            "auth_params": row[4],
-            "host_ip": row[5],
-            "host_names": row[6],
-            "host_names_regexp": row[7],
-            "host_names_like": row[8],
-            "default_roles_all": row[9],
-            "default_roles_list": row[10],
-            "default_roles_except": row[11],
-        }
-
-        user_info[user_name]["roles"] = get_user_roles(module, client, user_name)
-        user_info[user_name]["grants"] = get_grants(module, client, user_name)
+        user_info[user_name] = dict(zip(USERS_KEYS, row[1:]))
+
+        user_info[user_name]["roles"] = user_roles.get(user_name, [])
+        if module.params['include_grants']:
+            user_info[user_name]["grants"] = get_grants(module, client, user_name)
 
     return user_info
 
@@ -468,20 +556,27 @@ def get_grants(module, client, name):
 
     Return a list of grants.
     """
-    query = ("SHOW GRANTS FOR '%s'" % name)
-    result = execute_query(module, client, query)
+    query = "SHOW GRANTS FOR %(name)s"
+    exec_kwargs = {'params': {'name': name}}
+    result = execute_query(module, client, query, exec_kwargs)
     return [row[0] for row in result]
 
 
-def get_user_roles(module, client, user_name):
-    """Get user roles.
+def get_user_roles(module, client):
+    """Get roles granted to users.
 
-    Returns a list of roles.
+    Returns a dictionary with users names as keys
+    and lists of their roles as values.
     """
-    query = ("SELECT granted_role_name FROM system.role_grants "
-             "WHERE user_name = '%s'" % user_name)
+    query = ("SELECT user_name, granted_role_name FROM system.role_grants "
+             "WHERE user_name IS NOT NULL")
     result = execute_query(module, client, query)
-    return [row[0] for row in result]
+
+    user_roles = {}
+    for user_name, role_name in result:
+        user_roles.setdefault(user_name, []).append(role_name)
+
+    return user_roles
 
 
 def get_settings_profiles(module, client):
@@ -489,25 +584,14 @@ def get_settings_profiles(module, client):
 
     Returns a dictionary with profile names as keys.
     """
-    query = ("SELECT name, id, storage, num_elements, apply_to_all, apply_to_list, "
+    query = ("SELECT name, toString(id), storage, num_elements, apply_to_all, apply_to_list, "
              "apply_to_except FROM system.settings_profiles")
     result = execute_query(module, client, query)
 
     if result == PRIV_ERR_CODE:
         return {PRIV_ERR_CODE: "Not enough privileges"}
 
-    profile_info = {}
-    for row in result:
-        profile_info[row[0]] = {
-            "id": str(row[1]),
-            "storage": row[2],
-            "num_elements": row[3],
-            "apply_to_all": row[4],
-            "apply_to_list": row[5],
-            "apply_to_except": row[6],
-        }
-
-    return profile_info
+    return {row[0]: dict(zip(SETTINGS_PROFILES_KEYS, row[1:])) for row in result}
 
 
 def get_quotas(module, client):
@@ -515,26 +599,14 @@ def get_quotas(module, client):
 
     Returns a dictionary with quota names as keys.
     """
-    query = ("SELECT name, id, storage, keys, durations, apply_to_all, "
+    query = ("SELECT name, toString(id), storage, keys, durations, apply_to_all, "
              "apply_to_list, apply_to_except FROM system.quotas")
     result = execute_query(module, client, query)
 
     if result == PRIV_ERR_CODE:
         return {PRIV_ERR_CODE: "Not enough privileges"}
 
-    quota_info = {}
-    for row in result:
-        quota_info[row[0]] = {
-            "id": str(row[1]),
-            "storage": row[2],
-            "keys": row[3],
-            "durations": row[4],
-            "apply_to_all": row[5],
-            "apply_to_list": row[6],
-            "apply_to_except": row[7],
-        }
-
-    return quota_info
+    return {row[0]: dict(zip(QUOTAS_KEYS, row[1:])) for row in result}
 
 
 def get_all_grants(module, client):
@@ -542,7 +614,10 @@ def get_all_grants(module, client):
 
     Returns a dictionary with users and roles names as keys.
     """
-    query = ("SELECT user_name, role_name, access_type, database, "
+    # Grants belong either to a user or to a role,
+    # so let the server tell which one along with the name
+    query = ("SELECT if(user_name IS NOT NULL, 'users', 'roles'), "
+             "coalesce(user_name, role_name), access_type, database, "
              "table, column, is_partial_revoke, grant_option FROM system.grants")
 
     result = execute_query(module, client, query)
@@ -556,25 +631,7 @@ def get_all_grants(module, client):
     }
 
     for row in result:
-        if row[0] is not None:
-            dict_name = 'users'
-            name = row[0]
-            if row[0] not in grants_info[dict_name]:
-                grants_info[dict_name][name] = []
-        else:
-            dict_name = 'roles'
-            name = row[1]
-            if row[1] not in grants_info[dict_name]:
-                grants_info[dict_name][name] = []
-
-        grants_info[dict_name][name].append({
-            "access_type": row[2],
-            "database": row[3],
-            "table": row[4],
-            "column": row[5],
-            "is_partial_revoke": row[6],
-            "grant_option": row[7],
-        })
+        grants_info[row[0]].setdefault(row[1], []).append(dict(zip(GRANTS_KEYS, row[2:])))
 
     return grants_info
 
@@ -584,7 +641,11 @@ def get_settings_profile_elements(module, client):
 
     Returns a dictionary with roles, profiles and users names as keys.
     """
-    query = ("SELECT profile_name, user_name, role_name, "
+    # Elements belong to a profile, a user or a role,
+    # so let the server tell which one along with the name
+    query = ("SELECT multiIf(profile_name IS NOT NULL, 'profiles', "
+             "user_name IS NOT NULL, 'users', 'roles'), "
+             "coalesce(profile_name, user_name, role_name), "
              "index, setting_name, value, min, max, "
              "inherit_profile FROM system.settings_profile_elements")
     result = execute_query(module, client, query)
@@ -598,30 +659,8 @@ def get_settings_profile_elements(module, client):
                                  }
 
     for row in result:
-        if row[0] is not None:
-            dict_name = 'profiles'
-            name = row[0]
-            if row[0] not in settings_profile_elements[dict_name]:
-                settings_profile_elements[dict_name][name] = []
-        elif row[1] is not None:
-            dict_name = 'users'
-            name = row[1]
-            if row[1] not in settings_profile_elements[dict_name]:
-                settings_profile_elements[dict_name][name] = []
-        else:
-            dict_name = 'roles'
-            name = row[2]
-            if row[2] not in settings_profile_elements[dict_name]:
-                settings_profile_elements[dict_name][name] = []
-
-        settings_profile_elements[dict_name][name].append({
-            "index": row[3],
-            "setting_name": row[4],
-            "value": row[5],
-            "min": row[6],
-            "max": row[7],
-            "inherit_profile": row[8],
-        })
+        settings_profile_elements[row[0]].setdefault(row[1], []).append(
+            dict(zip(SETTINGS_PROFILE_ELEMENTS_KEYS, row[2:])))
 
     return settings_profile_elements
 
@@ -639,41 +678,59 @@ def get_storage_policies(module, client):
     if result == PRIV_ERR_CODE:
         return {PRIV_ERR_CODE: "Not enough privileges"}
 
-    storage_policies_info = {}
-    for row in result:
-        storage_policies_info[row[0]] = {
-            "volume_name": row[1],
-            "volume_priority": row[2],
-            "disks": row[3],
-            "volume_type": row[4],
-            "max_data_part_size": row[5],
-            "move_factor": row[6],
-            "prefer_not_to_merge": row[7],
-        }
-
-    return storage_policies_info
+    return {row[0]: dict(zip(STORAGE_POLICIES_KEYS, row[1:])) for row in result}
 
 
-def get_driver(module, client):
+def get_driver():
     """Gets driver information.
 
-    The module and client arguments are here
-    to provide a common interface and are ignored.
+    It does not need a connection to the server,
+    so it is not in RET_VAL_FUNC_MAPPING.
 
     Returns its version for now.
     """
     return {"version": version_clickhouse_driver()}
 
 
+# A mapping between ret values and functions.
+# When adding new values to return, add the value
+# and a corresponding function in this dictionary
+RET_VAL_FUNC_MAPPING = {
+    'version': get_server_version,
+    'databases': get_databases,
+    'users': get_users,
+    'roles': get_roles,
+    'settings': get_settings,
+    'clusters': get_clusters,
+    'dictionaries': get_dictionaries,
+    'tables': get_tables,
+    'merge_tree_settings': get_merge_tree_settings,
+    'quotas': get_quotas,
+    'settings_profiles': get_settings_profiles,
+    'settings_profile_elements': get_settings_profile_elements,
+    'storage_policies': get_storage_policies,
+    'grants': get_all_grants,
+}
+
+SUPPORTED_RET_VALS = frozenset(RET_VAL_FUNC_MAPPING) | frozenset(['driver'])
+
+
 def handle_limit_values(module, supported_ret_vals, limit):
     """Checks if passed limit values match module return values.
 
-    Prints a warning if do not match. Returns a list of stripped vals.
+    Prints a warning if do not match. Returns a list of stripped vals
+    without duplicates in the order they were passed.
     """
     stripped_vals = []
+    seen_vals = set()
     for wanted_val in limit:
         wanted_val = wanted_val.strip()
 
+        if wanted_val in seen_vals:
+            continue
+
+        seen_vals.add(wanted_val)
+
         if wanted_val not in supported_ret_vals:
             msg = ("The passed %s value does not exist in module return values: "
                    "please check the spelling and supported values, and try again" % wanted_val)
@@ -685,6 +742,69 @@ def handle_limit_values(module, supported_ret_vals, limit):
     return stripped_vals
 
 
+def gather_srv_info(module, main_conn_kwargs, client_kwargs, limit):
+    """Invokes the functions corresponding to the passed return values.
+
+    The queries are independent and most of the time is spent
+    waiting for the server, so the functions are run concurrently.
+    As the Client() object is not thread-safe,
+    each worker thread uses its own connection.
+    Plain threads are used as multiprocessing pools need
+    POSIX semaphores that are not available on all hosts.
+
+    Returns a dictionary with return values as keys.
+    """
+    if not limit:
+        return {}
+
+    workers = min(len(limit), module.params['max_connections'])
+    clients = [connect_to_db_via_client(module, main_conn_kwargs, client_kwargs)
+               for _ in range(workers)]
+
+    pending = queue.Queue()
+    for item in limit:
+        pending.put(item)
+
+    worker_module = WorkerModule(module)
+    result = {}
+    errors = []
+
+    def gather(client):
+        # Take the return values one by one until
+        # nothing is left or another worker has failed
+        while not errors:
+            try:
+                item = pending.get_nowait()
+            except queue.Empty:
+                return
+
+            try:
+                # This will invoke a proper function
+                result[item] = RET_VAL_FUNC_MAPPING[item](worker_module, client)
+            except Exception:
+                errors.append(sys.exc_info())
+                return
+
+    threads = [threading.Thread(target=gather, args=(client,)) for client in clients]
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        # Close connections
+        for client in clients:
+            client.disconnect_connection()
+
+    if errors:
+        if isinstance(errors[0][1], WorkerFailure):
+            module.fail_json(**errors[0][1].kwargs)
+        reraise(*errors[0])
+
+    # Keep the order of the passed return values
+    return dict((item, result[item]) for item in limit)
+
+
 def main():
     # Set up arguments.
     # If there are common arguments shared across several modules,
@@ -693,6 +813,12 @@ def main():
     argument_spec = client_common_argument_spec()
     argument_spec.update(
         limit=dict(type='list', elements='str'),
+        only_changed=dict(type='bool', default=False),
+        include_grants=dict(type='bool', default=True),
+        include_ddl=dict(type='bool', default=True),
+        include_exceptions=dict(type='bool', default=True),
+        include_stats=dict(type='bool', default=True),
+        max_connections=dict(type='int', default=8),
     )
 
     # Instantiate an object of module class
@@ -709,48 +835,26 @@ def main():
     # Such data must be passed as module arguments (not nested deep in values).
     main_conn_kwargs = get_main_conn_kwargs(module)
 
-    # Create a mapping between ret values and functions.
-    # When adding new values to return, add the value
-    # and a corresponding function in this dictionary
-    ret_val_func_mapping = {
-        'driver': get_driver,
-        'version': get_server_version,
-        'databases': get_databases,
-        'users': get_users,
-        'roles': get_roles,
-        'settings': get_settings,
-        'clusters': get_clusters,
-        'dictionaries': get_dictionaries,
-        'tables': get_tables,
-        'merge_tree_settings': get_merge_tree_settings,
-        'quotas': get_quotas,
-        'settings_profiles': get_settings_profiles,
-        'settings_profile_elements': get_settings_profile_elements,
-        'storage_policies': get_storage_policies,
-        'grants': get_all_grants,
-    }
+    if module.params['max_connections'] < 1:
+        module.fail_json(msg="The max_connections argument must be greater than 0")
+
     # Check if the limit is provided, it contains correct values
     limit = module.params['limit']
     if limit:
-        limit = handle_limit_values(module, ret_val_func_mapping.keys(), limit)
+        limit = handle_limit_values(module, SUPPORTED_RET_VALS, limit)
     else:
         # If no limit, just gather all ret values
-        limit = ret_val_func_mapping.keys()
+        limit = ['driver'] + list(RET_VAL_FUNC_MAPPING)
 
     # Will fail if no driver informing the user
     check_clickhouse_driver(module)
 
-    # Connect to DB
-    client = connect_to_db_via_client(module, main_conn_kwargs, client_kwargs)
-
-    # Get server information
-    srv_info = {}
-    for item in limit:
-        # This will invoke a proper function
-        srv_info[item] = ret_val_func_mapping[item](module, client)
-
-    # Close connection
-    client.disconnect_connection()
+    # Get server information.
+    # The driver information does not require querying the server
+    srv_info = gather_srv_info(module, main_conn_kwargs, client_kwargs,
+                               [val for val in limit if val != 'driver'])
+    if 'driver' in limit:
+        srv_info['driver'] = get_driver()
 
     # Users will get this in JSON output after execution
     module.exit_json(changed=False, **srv_info)
@@ -109,8 +109,9 @@ class ClickHouseRole:
         self.exists = self.check_exists()
 
     def check_exists(self):
-        query = "SELECT 1 FROM system.roles WHERE name = '%s' LIMIT 1" % self.name
-        result = execute_query(self.module, self.client, query)
+        query = "SELECT 1 FROM system.roles WHERE name = %(name)s LIMIT 1"
+        exec_kwargs = {'params': {'name': self.name}}
+        result = execute_query(self.module, self.client, query, exec_kwargs)
         return bool(result)
 
     def create(self):
@@ -122,11 +123,7 @@ class ClickHouseRole:
 
             list_settings = self.module.params['settings']
             if list_settings:
-                query += " SETTINGS"
-                for index, value in enumerate(list_settings):
-                    query += " %s" % value
-                    if index < len(list_settings) - 1:
-                        query += ","
+                query += " SETTINGS %s" % ", ".join(list_settings)
 
             executed_statements.append(query)
 
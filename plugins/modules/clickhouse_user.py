@@ -247,9 +247,10 @@ class ClickHouseUser():
         # Collecting user information
         query = ("SELECT name, storage, auth_type, default_roles_list "
                  "FROM system.users "
-                 "WHERE name = '%s'" % self.name)
+                 "WHERE name = %(name)s")
+        exec_kwargs = {'params': {'name': self.name}}
 
-        result = execute_query(self.module, self.client, query)
+        result = execute_query(self.module, self.client, query, exec_kwargs)
 
         if result == PRIV_ERR_CODE:
             login_user = self.module.params['login_user']
@@ -265,8 +266,9 @@ class ClickHouseUser():
 
     def __fetch_user_groups(self):
         query = ("SELECT granted_role_name FROM system.role_grants "
-                 "WHERE user_name = '%s'" % self.name)
-        result = execute_query(self.module, self.client, query)
+                 "WHERE user_name = %(name)s")
+        exec_kwargs = {'params': {'name': self.name}}
+        result = execute_query(self.module, self.client, query, exec_kwargs)
         return [row[0] for row in result]
 
     def create(self, type_password, password, cluster, settings,
@@ -281,11 +283,7 @@ class ClickHouseUser():
             query += " ON CLUSTER %s" % cluster
 
         if settings:
-            query += " SETTINGS"
-            for index, value in enumerate(settings):
-                query += " %s" % value
-                if index < len(settings) - 1:
-                    query += ","
+            query += " SETTINGS %s" % ", ".join(settings)
 
         executed_statements.append(query)
 
@@ -5,11 +5,16 @@ __metaclass__ = type
 import pytest
 from importlib.util import find_spec
 
+from ansible_collections.community.clickhouse.plugins.module_utils import clickhouse
 from ansible_collections.community.clickhouse.plugins.module_utils.clickhouse import (
     check_clickhouse_driver,
+    connect_to_db_via_client,
     version_clickhouse_driver,
     client_common_argument_spec,
+    execute_query,
     get_main_conn_kwargs,
+    get_server_version,
+    PRIV_ERR_CODE,
 )
 
 REASON = "The clickhouse_driver module is not installed"
@@ -30,6 +35,33 @@ class FakeAnsibleModule:
         print(msg)
 
 
+class FakeServerException(Exception):
+    def __init__(self, message, code):
+        super(FakeServerException, self).__init__(message)
+        self.code = code
+
+
+class FakeFailJson(Exception):
+    pass
+
+
+def fake_fail_json(msg):
+    raise FakeFailJson(msg)
+
+
+class FakeClient:
+    def __init__(self, exception=None, result=None):
+        self.exception = exception
+        self.result = result
+        self.executed = 0
+
+    def execute(self, query, **kwargs):
+        self.executed += 1
+        if self.exception is not None:
+            raise self.exception
+        return self.result
+
+
 def test_client_common_argument_spec():
     EXPECTED = {
         'login_db': {'type': 'str', 'default': None},
@@ -84,3 +116,75 @@ def test_check_clickhouse_driver():
     result = check_clickhouse_driver(fake_module)
 
     assert result is None or "clickhouse_driver" in result
+
+
+def test_execute_query_not_enough_privileges():
+    fake_module = FakeAnsibleModule()
+    exception = FakeServerException("Code: 497. DB::Exception: ...", PRIV_ERR_CODE)
+
+    assert execute_query(fake_module, FakeClient(exception), "SELECT 1") == PRIV_ERR_CODE
+
+
+def test_execute_query_fails():
+    fake_module = FakeAnsibleModule()
+    fake_module.fail_json = fake_fail_json
+    exception = FakeServerException("Not enough privileges in the message only", 60)
+
+    with pytest.raises(FakeFailJson, match="Failed to execute query"):
+        execute_query(fake_module, FakeClient(exception), "SELECT 1")
+
+
+@pytest.mark.parametrize(
+    'raw,version',
+    [
+        ('23.12.2.59',
+         {'raw': '23.12.2.59', 'year': 23, 'feature': 12,
+          'maintenance': 2, 'build': 59, 'type': None},
+         ),
+        ('24.3.1.2672-lts',
+         {'raw': '24.3.1.2672-lts', 'year': 24, 'feature': 3,
+          'maintenance': 1, 'build': 2672, 'type': 'lts'},
+         ),
+        ('23.8.9.54.altinitystable',
+         {'raw': '23.8.9.54.altinitystable', 'year': 23, 'feature': 8,
+          'maintenance': 9, 'build': 54, 'type': None},
+         ),
+    ]
+)
+def test_get_server_version(raw, version):
+    fake_module = FakeAnsibleModule()
+    fake_client = FakeClient(result=[(raw,)])
+
+    assert get_server_version(fake_module, fake_client) == version
+
+
+def test_get_server_version_unparsable():
+    fake_module = FakeAnsibleModule()
+    fake_module.fail_json = fake_fail_json
+    fake_client = FakeClient(result=[('unknown',)])
+
+    with pytest.raises(FakeFailJson, match="Failed to parse server version"):
+        get_server_version(fake_module, fake_client)
+
+
+def test_get_server_version_cached():
+    fake_module = FakeAnsibleModule()
+    fake_client = FakeClient(result=[('23.12.2.59',)])
+
+    first = get_server_version(fake_module, fake_client)
+    first['year'] = 0
+    second = get_server_version(fake_module, fake_client)
+
+    assert second['year'] == 23
+    assert fake_client.executed == 1
+
+
+def test_connect_to_db_via_client_keeps_kwargs(monkeypatch):
+    monkeypatch.setattr(clickhouse, 'Client', dict)
+    fake_module = FakeAnsibleModule()
+    client_kwargs = {'connect_timeout': 20}
+
+    client = connect_to_db_via_client(fake_module, {'host': 'localhost'}, client_kwargs)
+
+    assert client == {'connect_timeout': 20, 'host': 'localhost'}
+    assert client_kwargs == {'connect_timeout': 20}
@@ -0,0 +1,24 @@
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+from ansible_collections.community.clickhouse.plugins.modules.clickhouse_info import (
+    handle_limit_values,
+    SUPPORTED_RET_VALS,
+)
+
+
+class FakeAnsibleModule:
+    def __init__(self):
+        self.warnings = []
+
+    def warn(self, msg):
+        self.warnings.append(msg)
+
+
+def test_handle_limit_values():
+    fake_module = FakeAnsibleModule()
+    limit = ['users', ' roles', 'users ', 'fake', 'fake', 'version']
+
+    assert handle_limit_values(fake_module, SUPPORTED_RET_VALS, limit) == ['users', 'roles', 'version']
+    assert len(fake_module.warnings) == 1